@@ -17,8 +17,18 @@ import sys
 import os
 import subprocess
 import re
+import importlib.util
+import mmap
+import struct
+import threading
+import time
+import functools
+import zlib
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import TYPE_CHECKING, Optional, Dict, Iterator, List, Set, Tuple, Union
 
 # Platform-specific imports
 if sys.platform == 'win32':
@@ -27,12 +37,16 @@ if sys.platform == 'win32':
 try:
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-        QLabel, QPushButton, QComboBox, QListWidget, QListWidgetItem,
+        QLabel, QPushButton, QComboBox, QListView,
         QFileDialog, QProgressBar, QGroupBox, QMessageBox,
-        QTextEdit, QDialog, QScrollArea
+        QTextEdit, QDialog, QScrollArea, QToolTip
     )
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings
-    from PyQt6.QtGui import QIcon, QPixmap, QImage
+    from PyQt6.QtCore import (
+        Qt, QThread, pyqtSignal, QSettings, QEvent, QFileSystemWatcher,
+        QObject, QRunnable, QThreadPool, QAbstractListModel, QModelIndex,
+        QStandardPaths
+    )
+    from PyQt6.QtGui import QIcon, QPixmap, QPixmapCache, QImage
 except ImportError:
     print("PyQt6 not available. Install with: pip install PyQt6")
     sys.exit(1)
@@ -43,10 +57,172 @@ except ImportError:
     print("Pillow not available. Install with: pip install Pillow")
     sys.exit(1)
 
+# NumPy is slow to import and only needed once icons are decoded, so it is
+# imported inside the converter methods; just check it is installed here
+if importlib.util.find_spec("numpy") is None:
+    print("NumPy not available. Install with: pip install numpy")
+    sys.exit(1)
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # Application metadata
 APP_NAME = f"Entropia Universe Icon Extractor v{__version__}"
 
+# Application-wide theme stylesheets
+DARK_QSS = """
+    QMainWindow, QDialog {
+        background-color: #1e1e1e;
+    }
+    QWidget {
+        background-color: #1e1e1e;
+        color: #e0e0e0;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #404040;
+        border-radius: 6px;
+        margin-top: 12px;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px;
+    }
+    QPushButton {
+        background-color: #3d3d3d;
+        border: 1px solid #555;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-size: 12px;
+    }
+    QPushButton:hover {
+        background-color: #4d4d4d;
+    }
+    QComboBox {
+        background-color: #2d2d2d;
+        border: 1px solid #555;
+        padding: 5px;
+        border-radius: 4px;
+    }
+    QListView {
+        background-color: #252525;
+        border: 1px solid #404040;
+        border-radius: 4px;
+    }
+    QListView::item {
+        padding: 6px;
+    }
+    QListView::item:selected {
+        background-color: #1565c0;
+    }
+    QListView::item:hover {
+        background-color: #2a4d6e;
+    }
+    QProgressBar {
+        border: 1px solid #404040;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #4caf50;
+    }
+    QTextEdit {
+        background-color: #252525;
+        border: 1px solid #404040;
+    }
+    QLabel {
+        font-size: 12px;
+    }
+"""
+
+LIGHT_QSS = """
+    QMainWindow, QDialog {
+        background-color: #f5f5f5;
+    }
+    QWidget {
+        background-color: #f5f5f5;
+        color: #333333;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #cccccc;
+        border-radius: 6px;
+        margin-top: 12px;
+        padding-top: 12px;
+        color: #333333;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px;
+        color: #333333;
+    }
+    QPushButton {
+        background-color: #e0e0e0;
+        border: 1px solid #bbbbbb;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-size: 12px;
+        color: #333333;
+    }
+    QPushButton:hover {
+        background-color: #d0d0d0;
+    }
+    QComboBox {
+        background-color: #ffffff;
+        border: 1px solid #bbbbbb;
+        padding: 5px;
+        border-radius: 4px;
+        color: #333333;
+    }
+    QListView {
+        background-color: #ffffff;
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+    }
+    QListView::item {
+        padding: 6px;
+        color: #333333;
+    }
+    QListView::item:selected {
+        background-color: #1976d2;
+        color: #ffffff;
+    }
+    QListView::item:hover {
+        background-color: #e3f2fd;
+    }
+    QProgressBar {
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #4caf50;
+    }
+    QTextEdit {
+        background-color: #2d2818;
+        border: 1px solid #5d4e37;
+        color: #ffc107;
+    }
+    QLabel {
+        font-size: 12px;
+        color: #333333;
+    }
+"""
+
+# Cache path label styles, for a missing and a found cache source
+_CACHE_LABEL_ERROR_QSS = (
+    "font-family: Consolas; font-size: 10px; color: #f44336; "
+    "padding: 6px 8px; background: #3e2723; border-radius: 3px;"
+)
+_CACHE_LABEL_OK_QSS = (
+    "font-family: Consolas; font-size: 10px; color: #aaa; "
+    "padding: 6px 8px; background: #252525; border-radius: 3px;"
+)
+
 
 def get_steam_paths() -> List[Path]:
     """Get all possible Steam installation paths for the current platform."""
@@ -80,6 +256,10 @@ def get_steam_paths() -> List[Path]:
     return paths
 
 
+# "path" entries in Steam's libraryfolders.vdf
+_VDF_PATH_RE = re.compile(r'"path"\s+"([^"]+)"')
+
+
 def parse_library_folders_vdf(vdf_path: Path) -> List[Path]:
     """Parse Steam libraryfolders.vdf to find all library locations."""
     libraries = []
@@ -92,7 +272,7 @@ def parse_library_folders_vdf(vdf_path: Path) -> List[Path]:
             content = f.read()
         
         # Find all "path" entries in the vdf file
-        paths = re.findall(r'"path"\s+"([^"]+)"', content)
+        paths = _VDF_PATH_RE.findall(content)
         
         for path in paths:
             # Replace escaped backslashes (Windows format in VDF)
@@ -104,6 +284,30 @@ def parse_library_folders_vdf(vdf_path: Path) -> List[Path]:
     return libraries
 
 
+def iter_tga_files(root: Path) -> Iterator[str]:
+    """
+    Yield the paths of all .tga files under a folder, recursively.
+    Walks with os.scandir so no Path objects or extra stat calls are made;
+    unreadable folders are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith('.tga'):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def has_tga_files(folder: Path) -> bool:
+    """Check whether a folder or any of its subfolders contains a TGA file, stopping at the first one."""
+    return next(iter_tga_files(folder), None) is not None
+
+
 def find_all_cache_paths() -> List[Tuple[str, Path]]:
     """
     Find all Entropia Universe cache folders.
@@ -117,7 +321,7 @@ def find_all_cache_paths() -> List[Tuple[str, Path]]:
             with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\MindArk\Entropia Universe") as key:
                 parent_folder, _ = winreg.QueryValueEx(key, "PublicUsersDataParentFolder")
                 standard_path = Path(parent_folder) / "public_users_data" / "cache" / "icon"
-                if standard_path.exists() and list(standard_path.rglob("*.tga")):
+                if standard_path.exists() and has_tga_files(standard_path):
                     found_paths.append(("Standard Install", standard_path))
         except Exception:
             pass
@@ -125,33 +329,35 @@ def find_all_cache_paths() -> List[Tuple[str, Path]]:
         # Fallback to hardcoded path if registry fails
         if not found_paths:
             fallback_path = Path("C:/ProgramData/Entropia Universe/public_users_data/cache/icon")
-            if fallback_path.exists() and list(fallback_path.rglob("*.tga")):
+            if fallback_path.exists() and has_tga_files(fallback_path):
                 found_paths.append(("Standard Install", fallback_path))
     else:
         # Linux standard paths (if non-Steam install exists)
         standard_path = Path.home() / ".local" / "share" / "Entropia Universe" / "public_users_data" / "cache" / "icon"
-        if standard_path.exists() and list(standard_path.rglob("*.tga")):
+        if standard_path.exists() and has_tga_files(standard_path):
             found_paths.append(("Standard Install", standard_path))
     
-    # Check Steam installations
-    steam_paths = get_steam_paths()
+    # Check Steam installations: the default library of each install plus
+    # the others listed in its libraryfolders.vdf
+    steam_libraries = []
+    for steam_path in get_steam_paths():
+        steam_libraries.append(steam_path)
+        library_folders = steam_path / "steamapps" / "libraryfolders.vdf"
+        steam_libraries.extend(parse_library_folders_vdf(library_folders))
     
-    for steam_path in steam_paths:
-        # Check default Steam library
-        eu_path = steam_path / "steamapps" / "common" / "Entropia Universe" / "public_users_data" / "cache" / "icon"
-        if eu_path.exists() and list(eu_path.rglob("*.tga")):
+    # The default library is usually listed in the vdf as well, and the
+    # Linux Steam paths are often symlinks to one another, so only probe
+    # each real location once
+    seen = {os.path.realpath(path) for _, path in found_paths}
+    for library in steam_libraries:
+        eu_path = library / "steamapps" / "common" / "Entropia Universe" / "public_users_data" / "cache" / "icon"
+        real_path = os.path.realpath(eu_path)
+        if real_path in seen:
+            continue
+        seen.add(real_path)
+        
+        if eu_path.exists() and has_tga_files(eu_path):
             found_paths.append(("Steam", eu_path))
-        
-        # Check other Steam libraries
-        library_folders = steam_path / "steamapps" / "libraryfolders.vdf"
-        libraries = parse_library_folders_vdf(library_folders)
-        
-        for library in libraries:
-            eu_path = library / "steamapps" / "common" / "Entropia Universe" / "public_users_data" / "cache" / "icon"
-            if eu_path.exists() and list(eu_path.rglob("*.tga")):
-                # Check if we already have this path
-                if not any(str(p[1]) == str(eu_path) for p in found_paths):
-                    found_paths.append(("Steam", eu_path))
     
     return found_paths
 
@@ -164,21 +370,101 @@ def find_entropia_cache_path() -> Optional[Path]:
     return paths[0][1] if paths else None
 
 
+def find_tga_files(folder: Path) -> List[str]:
+    """
+    List the paths of the .tga files directly inside a folder.
+    Uses a single os.scandir pass and returns the entries' path strings,
+    so no Path objects are built.
+    """
+    try:
+        with os.scandir(folder) as it:
+            return [
+                entry.path for entry in it
+                if entry.name.lower().endswith('.tga') and entry.is_file()
+            ]
+    except OSError:
+        return []
+
+
+def sorted_tga_files(folder: Path) -> List[str]:
+    """List the paths of the .tga files directly inside a folder, in sorted order."""
+    # All entries share the folder prefix, so sorting the path strings
+    # orders them by name; normcase keeps the platform's (Windows:
+    # case-insensitive) Path ordering
+    return sorted(find_tga_files(folder), key=os.path.normcase)
+
+
+def find_subfolders(folder: Path) -> List[Path]:
+    """List the subfolders of a folder using a single os.scandir pass."""
+    try:
+        with os.scandir(folder) as it:
+            return [Path(entry.path) for entry in it if entry.is_dir()]
+    except OSError:
+        return []
+
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Frame PNG chunk data with its length and CRC."""
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', crc)
+
+
+def encode_png_rgba(pixels: "np.ndarray", compress_level: int = 6,
+                    compress_type: int = zlib.Z_DEFAULT_STRATEGY) -> bytes:
+    """
+    Encode a (height, width, 4) RGBA pixel array as an 8-bit PNG.
+    Every row uses the Up filter, computed with one NumPy subtraction,
+    instead of the per-row adaptive filter search Pillow's encoder runs.
+    """
+    import numpy as np
+    
+    height, width = pixels.shape[:2]
+    rows = pixels.reshape(height, width * 4)
+    
+    # Each scanline is prefixed with its filter type (2 = Up: difference
+    # from the row above, wrapping modulo 256)
+    filtered = np.empty((height, width * 4 + 1), dtype=np.uint8)
+    filtered[:, 0] = 2
+    filtered[0, 1:] = rows[0]
+    np.subtract(rows[1:], rows[:-1], out=filtered[1:, 1:])
+    
+    compressor = zlib.compressobj(compress_level, zlib.DEFLATED, 15, 8, compress_type)
+    idat = compressor.compress(filtered) + compressor.flush()
+    
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return (
+        _PNG_SIGNATURE
+        + _png_chunk(b'IHDR', ihdr)
+        + _png_chunk(b'IDAT', idat)
+        + _png_chunk(b'IEND', b'')
+    )
+
+
+# Little-endian layout of the 18-byte TGA header
+_TGA_HDR = struct.Struct('<BBBHHBHHHHBB')
+
+# Flags for raw header reads; O_BINARY only exists (and matters) on Windows
+_HEADER_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+
 class TGAHeader:
     """TGA file header structure."""
+    # Headers are cached per listed file, so skip the per-instance __dict__
+    __slots__ = (
+        'id_length', 'color_map_type', 'image_type',
+        'color_map_origin', 'color_map_length', 'color_map_depth',
+        'x_origin', 'y_origin', 'width', 'height',
+        'pixel_depth', 'image_descriptor',
+    )
+    
     def __init__(self, data: bytes):
-        self.id_length = data[0]
-        self.color_map_type = data[1]
-        self.image_type = data[2]
-        self.color_map_origin = int.from_bytes(data[3:5], 'little')
-        self.color_map_length = int.from_bytes(data[5:7], 'little')
-        self.color_map_depth = data[7]
-        self.x_origin = int.from_bytes(data[8:10], 'little')
-        self.y_origin = int.from_bytes(data[10:12], 'little')
-        self.width = int.from_bytes(data[12:14], 'little')
-        self.height = int.from_bytes(data[14:16], 'little')
-        self.pixel_depth = data[16]
-        self.image_descriptor = data[17]
+        (self.id_length, self.color_map_type, self.image_type,
+         self.color_map_origin, self.color_map_length, self.color_map_depth,
+         self.x_origin, self.y_origin, self.width, self.height,
+         self.pixel_depth, self.image_descriptor) = _TGA_HDR.unpack_from(data)
     
     def __str__(self):
         return f"{self.width}x{self.height}, {self.pixel_depth}bpp"
@@ -188,114 +474,566 @@ class TGAConverter:
     """Converter for TGA files to PNG with 320x320 canvas."""
     
     CANVAS_SIZE = (320, 320)
+    # zlib level 1 is several times faster than the default 6 and only
+    # slightly larger for small icons
+    PNG_COMPRESS_LEVEL = 1
+    # Run-length matching suits icons on a mostly transparent canvas: about
+    # a third smaller than the default strategy at the same speed
+    PNG_COMPRESS_TYPE = zlib.Z_RLE
+    # Folder under the app data location holding one index per output folder,
+    # recording the source of each PNG (kept out of the shared icon folder)
+    SOURCE_INDEX_DIR = "source_index"
     
     def __init__(self, output_dir: Optional[Path] = None):
         if output_dir is None:
             self.output_dir = Path.home() / "Documents" / "Entropia Universe" / "Icons"
         else:
             self.output_dir = output_dir
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Per-thread scratch canvas, reused for every icon instead of allocating a new one
+        self._local = threading.local()
+        self._stamps_lock = threading.Lock()
+    
+    @property
+    def output_dir(self) -> Path:
+        return self._output_dir
+    
+    @output_dir.setter
+    def output_dir(self, path: Path):
+        # The folder is created lazily on the first save into it
+        self._output_dir = path
+        self._dir_ready = False
+        # Output name -> [source path, size, mtime_ns], loaded on first use
+        self._source_stamps: Optional[Dict[str, list]] = None
+        self._stamps_changed = False
     
     def read_tga_header(self, filepath: Path) -> Optional[TGAHeader]:
         """Read TGA header from file."""
+        # A raw os.read skips building a buffered file object for an 18-byte probe
         try:
-            with open(filepath, 'rb') as f:
-                header_data = f.read(18)
-                if len(header_data) < 18:
-                    return None
-                return TGAHeader(header_data)
+            fd = os.open(filepath, _HEADER_OPEN_FLAGS)
+            try:
+                header_data = os.read(fd, 18)
+            finally:
+                os.close(fd)
+            if len(header_data) < 18:
+                return None
+            return TGAHeader(header_data)
         except Exception:
             return None
     
-    def load_tga_image(self, filepath: Path) -> Optional[Image.Image]:
-        """Load a TGA file as PIL Image."""
+    def load_tga_image(self, filepath: Path) -> Optional["np.ndarray"]:
+        """
+        Load a TGA file as a (height, width, 4) RGBA pixel array.
+        """
+        import numpy as np
+        
         try:
-            image = Image.open(filepath)
-            if image.mode != 'RGBA':
-                image = image.convert('RGBA')
-            return image
+            # Map the file instead of reading it into a bytes object; the
+            # decoders copy the pixels out before the mapping is closed
+            with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pixels = self._decode_tga_uncompressed(mm)
+                if pixels is not None:
+                    return pixels
+                
+                # Compressed, paletted and greyscale TGAs go through Pillow
+                with Image.open(mm) as image:
+                    if image.mode != 'RGBA':
+                        image = image.convert('RGBA')
+                    return np.asarray(image)
         except Exception:
             return None
     
+    def load_tga_thumbnail(self, filepath: Path, max_size: Tuple[int, int] = CANVAS_SIZE) -> Optional["np.ndarray"]:
+        """
+        Load a TGA file scaled down to fit within max_size, for previews.
+        The preview dialog caches the resulting pixmaps in QPixmapCache.
+        """
+        import numpy as np
+        
+        pixels = self.load_tga_image(filepath)
+        if pixels is None:
+            return None
+        
+        img_h, img_w = pixels.shape[:2]
+        if img_w > max_size[0] or img_h > max_size[1]:
+            image = Image.fromarray(pixels)
+            image.thumbnail(max_size, Image.Resampling.BILINEAR)
+            pixels = np.asarray(image)
+        
+        return pixels
+    
+    @staticmethod
+    def _decode_tga_uncompressed(data: Union[bytes, mmap.mmap]) -> Optional["np.ndarray"]:
+        """
+        Decode an uncompressed 24/32-bit true-color TGA with NumPy.
+        Returns None for any other subtype so the caller can fall back to Pillow.
+        """
+        import numpy as np
+        
+        if len(data) < 18:
+            return None
+        
+        header = TGAHeader(data)
+        if header.image_type != 2 or header.color_map_type != 0 or header.pixel_depth not in (24, 32):
+            return None
+        # Right-to-left pixel order is rare enough to leave to Pillow
+        if header.image_descriptor & 0x10:
+            return None
+        
+        channels = header.pixel_depth // 8
+        offset = 18 + header.id_length
+        size = header.width * header.height * channels
+        if size == 0 or len(data) < offset + size:
+            return None
+        
+        # Rows are stored bottom-up unless the top-left origin bit is set
+        bottom_up = not header.image_descriptor & 0x20
+        
+        if channels == 4:
+            # Treat each BGRA pixel as one little-endian word and swap the
+            # B and R bytes with whole-word operations, which is much faster
+            # than copying the channels through strided byte views
+            words = np.frombuffer(data, dtype='<u4', count=header.width * header.height, offset=offset)
+            words = words.reshape(header.height, header.width)
+            if bottom_up:
+                words = words[::-1]
+            
+            rgba = np.bitwise_and(words, 0xFF00FF00)
+            swap = np.right_shift(words, 16)
+            swap &= 0xFF
+            rgba |= swap
+            np.bitwise_and(words, 0xFF, out=swap)
+            swap <<= 16
+            rgba |= swap
+            return rgba.view(np.uint8).reshape(header.height, header.width, 4)
+        
+        pixels = np.frombuffer(data, dtype=np.uint8, count=size, offset=offset)
+        pixels = pixels.reshape(header.height, header.width, channels)
+        if bottom_up:
+            pixels = pixels[::-1]
+        
+        # BGR -> RGBA in one output allocation, with opaque alpha
+        rgba = np.empty((header.height, header.width, 4), dtype=np.uint8)
+        rgba[..., :3] = pixels[..., 2::-1]
+        rgba[..., 3] = 255
+        return rgba
+    
+    @staticmethod
+    def _source_stamp(tga_path: Path) -> Optional[list]:
+        """Identify a source file by path, size and modification time."""
+        try:
+            st = tga_path.stat()
+        except OSError:
+            return None
+        return [str(tga_path), st.st_size, st.st_mtime_ns]
+    
+    def _source_index_path(self) -> Optional[Path]:
+        """Path of the output folder's source index in the app data location, if there is one."""
+        app_data = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+        if not app_data:
+            return None
+        folder_key = os.path.normcase(os.path.abspath(self.output_dir))
+        digest = hashlib.sha1(folder_key.encode('utf-8')).hexdigest()
+        return Path(app_data) / self.SOURCE_INDEX_DIR / f"{digest}.json"
+    
+    def _load_source_stamps(self) -> Dict[str, list]:
+        """Load the output folder's source index on first use."""
+        with self._stamps_lock:
+            if self._source_stamps is None:
+                stamps = None
+                index_path = self._source_index_path()
+                if index_path is not None:
+                    try:
+                        with open(index_path, encoding='utf-8') as f:
+                            stamps = json.load(f)
+                    except (OSError, ValueError):
+                        pass
+                self._source_stamps = stamps if isinstance(stamps, dict) else {}
+            return self._source_stamps
+    
+    def save_source_stamps(self):
+        """Write the output folder's source index back if conversions changed it."""
+        with self._stamps_lock:
+            if not self._stamps_changed:
+                return
+            index_path = self._source_index_path()
+            if index_path is None:
+                return
+            temp_path = index_path.with_name(f"{index_path.name}.tmp")
+            try:
+                index_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path.write_text(json.dumps(self._source_stamps), encoding='utf-8')
+                os.replace(temp_path, index_path)
+                self._stamps_changed = False
+            except OSError:
+                pass
+    
+    def find_up_to_date_output(self, tga_path: Path, output_name: Optional[str] = None) -> Optional[Path]:
+        """Return the existing PNG for a TGA file if it was converted from this exact source file."""
+        if output_name is None:
+            output_name = tga_path.stem
+        
+        # PNGs are named after the icon alone, so a newer PNG may come from
+        # another version folder; only reuse it if it was made from this file
+        stamp = self._source_stamp(tga_path)
+        if stamp is None or self._load_source_stamps().get(output_name) != stamp:
+            return None
+        
+        output_path = self.output_dir / f"{output_name}.png"
+        return output_path if output_path.exists() else None
+    
     def convert_tga_to_png(self, tga_path: Path, output_name: Optional[str] = None) -> Optional[Path]:
         """Convert a TGA file to PNG with 320x320 canvas."""
         try:
-            image = self.load_tga_image(tga_path)
-            if not image:
+            # Stamped before decoding, so a change made meanwhile is picked up next time
+            stamp = self._source_stamp(tga_path)
+            pixels = self.load_tga_image(tga_path)
+            if pixels is None:
                 return None
             
-            image = self._apply_canvas(image)
-            
             if output_name is None:
                 output_name = tga_path.stem
             
-            # Ensure output directory exists before saving
-            self.output_dir.mkdir(parents=True, exist_ok=True)
+            # Ensure output directory exists before the first save
+            if not self._dir_ready:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
             
             output_path = self.output_dir / f"{output_name}.png"
-            image.save(output_path, 'PNG')
+            
+            canvas_w, canvas_h = self.CANVAS_SIZE
+            img_h, img_w = pixels.shape[:2]
+            if img_w <= canvas_w and img_h <= canvas_h:
+                self._fast_canvas_and_save(pixels, output_path)
+            else:
+                self._save_png(self._apply_canvas(pixels), output_path)
+            
+            if stamp is not None:
+                self._load_source_stamps()[output_name] = stamp
+                self._stamps_changed = True
             
             return output_path
             
         except Exception:
             return None
     
-    def _apply_canvas(self, image: Image.Image) -> Image.Image:
-        """Place image centered on a 320x320 canvas."""
+    def _fast_canvas_and_save(self, pixels: "np.ndarray", output_path: Path):
+        """
+        Save RGBA pixels that fit on the canvas, centered, as a PNG.
+        This is the path nearly every cache icon takes, so it skips the
+        cropping logic of _apply_canvas.
+        """
         canvas_w, canvas_h = self.CANVAS_SIZE
-        img_w, img_h = image.size
+        img_h, img_w = pixels.shape[:2]
+        if img_w == canvas_w and img_h == canvas_h:
+            # Already canvas-sized: nothing to center, save the pixels as-is
+            self._save_png(pixels, output_path)
+            return
         
-        canvas = Image.new('RGBA', self.CANVAS_SIZE, (0, 0, 0, 0))
+        x = (canvas_w - img_w) // 2
+        y = (canvas_h - img_h) // 2
+        
+        self._save_png(self._blit_to_canvas(pixels, x, y), output_path)
+    
+    def _save_png(self, pixels: "np.ndarray", output_path: Path):
+        """Save RGBA pixels as PNG with the converter's encoder settings."""
+        png_data = encode_png_rgba(pixels, self.PNG_COMPRESS_LEVEL, self.PNG_COMPRESS_TYPE)
+        
+        # Write to a per-thread temp file and swap it in, so parallel
+        # conversions of icons with the same name never interleave
+        temp_path = output_path.with_name(f"{output_path.name}.{threading.get_ident()}.tmp")
+        try:
+            try:
+                temp_path.write_bytes(png_data)
+            except FileNotFoundError:
+                # The output folder was removed after it was first created
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                temp_path.write_bytes(png_data)
+            os.replace(temp_path, output_path)
+        except OSError:
+            # Don't leave a partial temp file behind in the icon folder
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            raise
+    
+    def _get_canvas_buffer(self) -> "np.ndarray":
+        """Get the calling thread's scratch canvas buffer, allocating it on first use."""
+        buf = getattr(self._local, 'canvas_buf', None)
+        if buf is None:
+            import numpy as np
+            canvas_w, canvas_h = self.CANVAS_SIZE
+            buf = np.zeros((canvas_h, canvas_w, 4), dtype=np.uint8)
+            self._local.canvas_buf = buf
+            self._local.canvas_rect = None
+        return buf
+    
+    def _blit_to_canvas(self, pixels: "np.ndarray", x: int, y: int) -> "np.ndarray":
+        """
+        Copy pixels into the thread's canvas buffer at (x, y), leaving the
+        rest of the canvas transparent.
+        Only the area written by the previous icon is cleared, since
+        everything outside it is still zero.
+        """
+        buf = self._get_canvas_buffer()
+        prev = self._local.canvas_rect
+        if prev is not None:
+            prev_x, prev_y, prev_w, prev_h = prev
+            buf[prev_y:prev_y + prev_h, prev_x:prev_x + prev_w] = 0
+        
+        h, w = pixels.shape[:2]
+        buf[y:y + h, x:x + w] = pixels
+        self._local.canvas_rect = (x, y, w, h)
+        return buf
+    
+    def _apply_canvas(self, pixels: "np.ndarray") -> "np.ndarray":
+        """
+        Place RGBA pixels centered on a 320x320 canvas.
+        The returned array is the thread's scratch canvas
+        buffer, so it is only valid until the next call on the same thread.
+        """
+        canvas_w, canvas_h = self.CANVAS_SIZE
+        img_h, img_w = pixels.shape[:2]
         
         x = (canvas_w - img_w) // 2
         y = (canvas_h - img_h) // 2
         
-        canvas.paste(image, (x, y), image if image.mode == 'RGBA' else None)
-        return canvas
+        # Crop images larger than the canvas around their center
+        if x < 0:
+            pixels = pixels[:, -x:-x + canvas_w]
+            x = 0
+        if y < 0:
+            pixels = pixels[-y:-y + canvas_h]
+            y = 0
+        
+        return self._blit_to_canvas(pixels, x, y)
 
 
 class ConversionWorker(QThread):
     """Background worker for batch conversion."""
-    progress = pyqtSignal(str)
-    file_done = pyqtSignal(str, str)
+    progress = pyqtSignal(int, str)
+    # List of (filename, output_path, cached) tuples, emitted in batches
+    file_done_batch = pyqtSignal(list)
     finished = pyqtSignal(int, int)
     error = pyqtSignal(str)
     
+    # Coalesce UI updates to at most one per BATCH_SIZE files (or 1/PROGRESS_STEPS
+    # of the run, if larger) or FLUSH_INTERVAL seconds
+    BATCH_SIZE = 32
+    PROGRESS_STEPS = 200
+    FLUSH_INTERVAL = 0.1
+    
     def __init__(self, files: List[Path], converter: TGAConverter):
         super().__init__()
+        # Callers pass the files through unique_output_names first
         self.files = files
         self.converter = converter
         self._running = True
+        self._futures = {}
     
     def run(self):
-        """Run conversion."""
+        """Run conversion on a thread pool, one task per file."""
         try:
             success = 0
+            done = 0
             total = len(self.files)
+            # Decoding (NumPy) and PNG encoding (zlib.compressobj in
+            # encode_png_rgba) both run without the GIL, so threads scale
+            # with the available cores
+            max_workers = os.cpu_count() or 4
+            # Progress moves in steps the bar can show anyway
+            flush_every = max(self.BATCH_SIZE, total // self.PROGRESS_STEPS)
+            
+            batch = []
+            unreported = 0
+            last_flush = time.monotonic()
             
-            for i, filepath in enumerate(self.files):
+            # Smallest files first: better read locality on cold caches, and
+            # large files overlap with the tail of the small ones
+            files = sorted(self.files, key=self._file_size)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = self._futures = {
+                    executor.submit(self._convert_file, filepath): filepath
+                    for filepath in files
+                }
                 if not self._running:
-                    break
-                
-                self.progress.emit(f"[{i+1}/{total}] {filepath.name}")
+                    self._cancel_pending()
                 
-                output = self.converter.convert_tga_to_png(filepath)
-                
-                if output:
-                    success += 1
-                    self.file_done.emit(filepath.name, str(output))
+                for future in as_completed(futures):
+                    if not self._running:
+                        break
+                    
+                    filepath = futures[future]
+                    done += 1
+                    unreported += 1
+                    
+                    output, cached = future.result()
+                    
+                    if output:
+                        success += 1
+                        batch.append((filepath.name, str(output), cached))
+                    
+                    now = time.monotonic()
+                    if unreported >= flush_every or now - last_flush >= self.FLUSH_INTERVAL or done == total:
+                        self.progress.emit(done, f"[{done}/{total}] {filepath.name}")
+                        if batch:
+                            self.file_done_batch.emit(batch)
+                            batch = []
+                        unreported = 0
+                        last_flush = now
             
+            if batch:
+                self.file_done_batch.emit(batch)
+            
+            self.converter.save_source_stamps()
             self.finished.emit(success, total)
             
         except Exception as e:
+            self.converter.save_source_stamps()
             self.error.emit(str(e))
     
+    @staticmethod
+    def unique_output_names(files: List[Path]) -> List[Path]:
+        """
+        Drop files whose PNG name is taken by another file in the list.
+        Icons are saved by name alone, so when version folders share an
+        icon name only the last copy in path order is kept.
+        """
+        by_name = {}
+        for filepath in sorted(files, key=lambda path: os.path.normcase(str(path))):
+            by_name[os.path.normcase(filepath.stem)] = filepath
+        return list(by_name.values())
+    
+    @staticmethod
+    def _file_size(filepath: Path) -> int:
+        try:
+            return filepath.stat().st_size
+        except OSError:
+            return 0
+    
+    def _convert_file(self, filepath: Path) -> Tuple[Optional[Path], bool]:
+        """Convert one file, reusing its PNG if the source has not changed since."""
+        output = self.converter.find_up_to_date_output(filepath)
+        if output:
+            return output, True
+        return self.converter.convert_tga_to_png(filepath), False
+    
+    def _cancel_pending(self):
+        for future in list(self._futures):
+            future.cancel()
+    
     def stop(self):
         self._running = False
+        # Drop queued conversions now instead of after the next one finishes
+        self._cancel_pending()
+
+
+class FolderScanSignals(QObject):
+    """Signals for FolderScan, since a QRunnable cannot emit signals itself."""
+    # Scan generation, folder index, folder mtime_ns (None if unreadable), sorted TGA paths
+    folder_scanned = pyqtSignal(int, int, object, list)
+    finished = pyqtSignal(int)  # scan generation
+
+
+class FolderScan(QRunnable):
+    """
+    List the TGA files of version folders on a QThreadPool thread.
+    Folders whose mtime matches the given snapshot of earlier listings are
+    not listed again. The listings are only reported; the window caches them
+    on the GUI thread.
+    """
+    
+    def __init__(self, generation: int, folders: List[Path],
+                 cached: Dict[Path, Tuple[int, List[str]]], signals: FolderScanSignals):
+        super().__init__()
+        self.generation = generation
+        self.folders = folders
+        self.cached = cached
+        self.signals = signals
+    
+    def _list_folder(self, folder: Path) -> Tuple[Optional[int], List[str]]:
+        # Stat before listing, so the recorded mtime is never newer than the listing
+        try:
+            mtime_ns = folder.stat().st_mtime_ns
+        except OSError:
+            return None, []
+        cached = self.cached.get(folder)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached
+        return mtime_ns, sorted_tga_files(folder)
+    
+    def run(self):
+        # Folder scans are independent and I/O-bound (os.scandir releases
+        # the GIL), so list them concurrently
+        with ThreadPoolExecutor(max_workers=min(32, len(self.folders))) as executor:
+            for index, (mtime_ns, files) in enumerate(executor.map(self._list_folder, self.folders)):
+                self.signals.folder_scanned.emit(self.generation, index, mtime_ns, files)
+        self.signals.finished.emit(self.generation)
+
+
+class HeaderProbeSignals(QObject):
+    """Signals for HeaderProbe, since a QRunnable cannot emit signals itself."""
+    header_read = pyqtSignal(str, object)  # file path, TGAHeader or None
+
+
+class HeaderProbe(QRunnable):
+    """Read the headers of a batch of TGA files on a QThreadPool thread."""
+    
+    def __init__(self, paths: List[str], converter: TGAConverter, signals: HeaderProbeSignals):
+        super().__init__()
+        self.paths = paths
+        self.converter = converter
+        self.signals = signals
+    
+    def run(self):
+        for path in self.paths:
+            self.signals.header_read.emit(path, self.converter.read_tga_header(Path(path)))
+
+
+class TgaListModel(QAbstractListModel):
+    """
+    File list model backed by plain lists of labels and paths,
+    so a large icon set does not need one QListWidgetItem per file.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        self._paths: List[str] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._paths[index.row()]
+        return None
+    
+    def set_files(self, names: List[str], paths: List[str]):
+        """
+        Replace the listed files with a single model reset.
+        Unchanged files are left alone, which keeps the view's selection and scroll position.
+        """
+        if names == self._names and paths == self._paths:
+            return
+        self.beginResetModel()
+        self._names = names
+        self._paths = paths
+        self.endResetModel()
+    
+    def path(self, row: int) -> str:
+        return self._paths[row]
 
 
 class PreviewDialog(QDialog):
-    """Dialog to preview a TGA file at original resolution."""
+    """Dialog to preview a TGA file, scaled down if larger than the icon canvas."""
     
     def __init__(self, tga_path: Path, converter: TGAConverter, parent=None):
         super().__init__(parent)
@@ -310,11 +1048,9 @@ class PreviewDialog(QDialog):
             info_label.setStyleSheet("color: #888; font-size: 13px; font-weight: bold;")
             layout.addWidget(info_label)
         
-        image = converter.load_tga_image(tga_path)
-        if image:
-            img_data = image.tobytes("raw", "RGBA")
-            qimage = QImage(img_data, image.width, image.height, QImage.Format.Format_RGBA8888)
-            pixmap = QPixmap.fromImage(qimage)
+        pixmap = self._load_pixmap(tga_path, converter)
+        if pixmap is not None:
+            img_w, img_h = pixmap.width(), pixmap.height()
             
             img_label = QLabel()
             img_label.setPixmap(pixmap)
@@ -324,17 +1060,20 @@ class PreviewDialog(QDialog):
             scroll = QScrollArea()
             scroll.setWidget(img_label)
             scroll.setWidgetResizable(True)
-            scroll.setMinimumSize(min(image.width + 40, 800), min(image.height + 40, 600))
+            scroll.setMinimumSize(min(img_w + 40, 800), min(img_h + 40, 600))
             scroll.setMaximumSize(800, 600)
             layout.addWidget(scroll)
             
-            size_label = QLabel(f"Displayed at: {image.width}x{image.height} (Original Size)")
+            if info and (img_w, img_h) != (info.width, info.height):
+                size_label = QLabel(f"Displayed at: {img_w}x{img_h} (Scaled Down)")
+            else:
+                size_label = QLabel(f"Displayed at: {img_w}x{img_h} (Original Size)")
             size_label.setStyleSheet("color: #4caf50; font-size: 12px;")
             size_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             layout.addWidget(size_label)
             
-            dialog_width = min(image.width + 50, 820)
-            dialog_height = min(image.height + 150, 700)
+            dialog_width = min(img_w + 50, 820)
+            dialog_height = min(img_h + 150, 700)
             self.resize(dialog_width, dialog_height)
         else:
             error_label = QLabel("Failed to load image")
@@ -344,6 +1083,33 @@ class PreviewDialog(QDialog):
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(close_btn)
+    
+    @staticmethod
+    def _load_pixmap(tga_path: Path, converter: TGAConverter) -> Optional[QPixmap]:
+        """Load the preview pixmap, reusing it from QPixmapCache while the file is unchanged."""
+        try:
+            key = f"preview:{tga_path}:{tga_path.stat().st_mtime_ns}"
+        except OSError:
+            return None
+        
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        
+        pixels = converter.load_tga_thumbnail(tga_path)
+        if pixels is None:
+            return None
+        
+        import numpy as np
+        
+        # QImage wraps the array memory without copying; fromImage then
+        # copies it into the pixmap, so the array need not outlive this call
+        pixels = np.ascontiguousarray(pixels)
+        img_h, img_w = pixels.shape[:2]
+        qimage = QImage(pixels.data, img_w, img_h, pixels.strides[0], QImage.Format.Format_RGBA8888)
+        pixmap = QPixmap.fromImage(qimage)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
 
 
 class IconExtractorWindow(QMainWindow):
@@ -357,15 +1123,52 @@ class IconExtractorWindow(QMainWindow):
         
         self.converter = TGAConverter()
         self.worker: Optional[ConversionWorker] = None
-        self.found_files: List[Path] = []
+        # File path -> header, read in the background when a list item is hovered
+        self._header_cache: Dict[str, Optional[TGAHeader]] = {}
+        self._headers_pending: Set[str] = set()
+        self._header_signals = HeaderProbeSignals(self)
+        self._header_signals.header_read.connect(self._on_header_read)
+        # (file path, global position) of the tooltip waiting for its header
+        self._tooltip_request = None
+        self.cached_count = 0
+        # Files left out of the current extraction because their icon name repeats
+        self.duplicate_count = 0
+        # Path strings of the listed files; Path objects are only built for conversion
+        self.found_files: List[str] = []
+        self._theme = 'dark'  # main() starts the application in the dark theme
+        # Version folder -> (folder mtime, TGA files), shared by detection and listing
+        self._tga_cache: Dict[Path, Tuple[int, List[str]]] = {}
+        # Version folders with icons in the selected source(s), from the last detection
+        self._version_folders: List[Path] = []
+        # (label, data) of the version combo entries, to skip rebuilding it unchanged
+        self._version_entries: Optional[List[Tuple[str, str]]] = None
+        # Background version folder scan; results from superseded scans are ignored
+        self._scan_generation = 0
+        self._scan_placeholders = False
+        self._scan_folders: List[Tuple[Path, Path]] = []
+        self._scan_counts: List[int] = []
+        # Folders changed on disk since the current scan started, whose listing is stale
+        self._scan_changed: Set[Path] = set()
+        # Every version folder (with icons or not) of the selected source(s) in the last completed scan
+        self._scanned_folders: Optional[Set[Path]] = None
+        # Icons per cache source, from the last completed scan
+        self._source_counts: Dict[Path, int] = {}
+        self._scan_signals = FolderScanSignals(self)
+        self._scan_signals.folder_scanned.connect(self._on_folder_scanned)
+        self._scan_signals.finished.connect(self._on_folder_scan_finished)
+        # Watched version folders drop their cached listing when they change,
+        # so switching folders can reuse it without touching the disk
+        self._watched_folders: Set[Path] = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        
+        self.settings = QSettings("ImpulsiveFPS", "EUIconExtractor")
         
         # Find all cache sources (standard, steam, etc.)
-        self.cache_sources = find_all_cache_paths()  # List of (name, path) tuples
+        self.cache_sources = self._find_cache_sources()  # List of (name, path) tuples
         self.selected_source_index = 0  # 0 = All Sources, 1+ = specific source
         self.cache_path_manually_set = False
         
-        self.settings = QSettings("ImpulsiveFPS", "EUIconExtractor")
-        
         self._setup_ui()
         self._load_icon()
         self._load_settings()
@@ -377,41 +1180,106 @@ class IconExtractorWindow(QMainWindow):
         else:
             self._show_cache_not_found()
     
+    def _find_cache_sources(self, rescan: bool = False) -> List[Tuple[str, Path]]:
+        """
+        Find the cache sources, reusing the ones found at the last launch
+        while they all still exist. rescan forces a fresh search.
+        """
+        names = self.settings.value("cache_source_names", [], type=list)
+        paths = self.settings.value("cache_source_paths", [], type=list)
+        if not rescan and names and len(names) == len(paths):
+            sources = [(name, Path(path)) for name, path in zip(names, paths)]
+            if all(path.is_dir() for _, path in sources):
+                return sources
+        
+        sources = find_all_cache_paths()
+        self.settings.setValue("cache_source_names", [name for name, _ in sources])
+        self.settings.setValue("cache_source_paths", [str(path) for _, path in sources])
+        return sources
+    
+    def _refresh_cache_sources(self):
+        """Search for cache sources again, keeping manually added ones and the current selection."""
+        selected = self.source_combo.currentData()
+        manual = [source for source in self.cache_sources if source[0] == "Manual"]
+        self.cache_sources = self._find_cache_sources(rescan=True) + manual
+        
+        if not self.cache_sources:
+            self._show_cache_not_found()
+            return
+        
+        self._populate_source_combo()
+        index = self.source_combo.findData(selected)
+        if index > 0:
+            self.source_combo.blockSignals(True)
+            self.source_combo.setCurrentIndex(index)
+            self.source_combo.blockSignals(False)
+        self._detect_subfolders()
+    
     def _show_cache_not_found(self):
         """Show message when cache folder is not found."""
-        self.cache_label.setText("❌ Cache folder not found")
-        self.cache_label.setStyleSheet(
-            "font-family: Consolas; font-size: 10px; color: #f44336; "
-            "padding: 6px 8px; background: #3e2723; border-radius: 3px;"
-        )
+        self._set_cache_label("❌ Cache folder not found", _CACHE_LABEL_ERROR_QSS)
+        self.source_combo.blockSignals(True)
         self.source_combo.clear()
         self.source_combo.addItem("❌ No sources found")
+        self.source_combo.blockSignals(False)
         self.source_combo.setEnabled(False)
+        
+        # A refresh can lose every source at runtime, so drop the previous
+        # source's versions and files (and any scan still counting them)
+        self._scan_generation += 1
+        self._version_folders = []
+        self._scanned_folders = None
+        self._version_entries = None
+        self.version_combo.clear()
+        self.files_model.set_files([], [])
+        self.found_files = []
+        
         self.status_label.setText("Click 'Browse...' to select the cache folder manually")
         self.files_count_label.setText("No cache folder selected")
         self.convert_btn.setEnabled(False)
     
     def _populate_source_combo(self):
-        """Populate the source selection dropdown with found cache sources."""
+        """
+        Populate the source selection dropdown with found cache sources.
+        Counts come from the background folder scan, so sources it has not
+        counted yet show a placeholder until _set_source_counts fills them in.
+        """
+        count_texts = [
+            f"{self._source_counts[path]} icons" if path in self._source_counts else "counting..."
+            for _, path in self.cache_sources
+        ]
+        if all(path in self._source_counts for _, path in self.cache_sources):
+            total_text = f"{sum(self._source_counts[path] for _, path in self.cache_sources)} icons"
+        else:
+            total_text = "counting..."
+        
+        # Callers rescan the chosen source themselves, so don't let every
+        # insert trigger a rescan
+        self.source_combo.blockSignals(True)
         self.source_combo.clear()
         self.source_combo.setEnabled(True)
         
-        # Count total icons across all sources
-        total_icons = 0
-        for name, path in self.cache_sources:
-            total_icons += len(list(path.rglob("*.tga")))
-        
         # Add "All Sources" option
-        self.source_combo.addItem(f"🌐 All Sources ({total_icons} icons)", "all")
+        self.source_combo.addItem(f"🌐 All Sources ({total_text})", "all")
         
         # Add individual sources
-        for name, path in self.cache_sources:
-            icon_count = len(list(path.rglob("*.tga")))
-            display_name = f"📁 {name}: {path.parent.parent.parent.name if path.parent.parent.parent != path else 'Entropia Universe'} ({icon_count} icons)"
-            self.source_combo.addItem(display_name, str(path))
-        
-        # Connect source change handler
-        self.source_combo.currentIndexChanged.connect(self._on_source_changed)
+        for (name, path), count_text in zip(self.cache_sources, count_texts):
+            self.source_combo.addItem(self._source_label(name, path, count_text), str(path))
+        self.source_combo.blockSignals(False)
+    
+    def _source_label(self, name: str, path: Path, count_text: str) -> str:
+        """Source combo label for a cache source."""
+        install_name = path.parent.parent.parent.name if path.parent.parent.parent != path else 'Entropia Universe'
+        return f"📁 {name}: {install_name} ({count_text})"
+    
+    def _set_source_counts(self, source_counts: Dict[Path, int]):
+        """Show the icon counts of a completed scan in the source combo."""
+        self._source_counts = source_counts
+        if self.source_combo.count() != len(self.cache_sources) + 1:
+            return
+        self.source_combo.setItemText(0, f"🌐 All Sources ({sum(source_counts.values())} icons)")
+        for row, (name, path) in enumerate(self.cache_sources, start=1):
+            self.source_combo.setItemText(row, self._source_label(name, path, f"{source_counts[path]} icons"))
     
     def _on_source_changed(self):
         """Handle source selection change."""
@@ -430,17 +1298,13 @@ class IconExtractorWindow(QMainWindow):
         if folder:
             selected_path = Path(folder)
             # Check if this folder or any subfolder contains TGA files
-            tga_files = list(selected_path.rglob("*.tga"))
-            
-            if tga_files:
+            if has_tga_files(selected_path):
                 # Add as a manual source
                 self.cache_sources.append(("Manual", selected_path))
                 self.cache_path_manually_set = True
                 self._populate_source_combo()
-                # Select the newly added source (last index)
+                # Select the newly added source (last index), which rescans it
                 self.source_combo.setCurrentIndex(len(self.cache_sources))
-                self.status_label.setText(f"Found {len(tga_files)} TGA files")
-                self._detect_subfolders()
             else:
                 QMessageBox.warning(
                     self,
@@ -531,16 +1395,14 @@ class IconExtractorWindow(QMainWindow):
         self.source_combo = QComboBox()
         self.source_combo.setMinimumWidth(250)
         self.source_combo.setStyleSheet("font-size: 12px; padding: 3px;")
+        self.source_combo.currentIndexChanged.connect(self._on_source_changed)
         source_layout.addWidget(self.source_combo, 1)
         
         cache_layout.addLayout(source_layout)
         
         # Path display label
         self.cache_label = QLabel("Scanning for cache folders...")
-        self.cache_label.setStyleSheet(
-            "font-family: Consolas; font-size: 10px; color: #aaa; "
-            "padding: 6px 8px; background: #252525; border-radius: 3px;"
-        )
+        self.cache_label.setStyleSheet(_CACHE_LABEL_OK_QSS)
         self.cache_label.setWordWrap(True)
         cache_layout.addWidget(self.cache_label)
         
@@ -561,7 +1423,7 @@ class IconExtractorWindow(QMainWindow):
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.setMaximumWidth(80)
         refresh_btn.setStyleSheet("font-size: 11px; padding: 4px;")
-        refresh_btn.clicked.connect(self._detect_subfolders)
+        refresh_btn.clicked.connect(self._refresh_cache_sources)
         version_layout.addWidget(refresh_btn)
         
         cache_layout.addLayout(version_layout)
@@ -617,10 +1479,14 @@ class IconExtractorWindow(QMainWindow):
         self.files_count_label.setStyleSheet("font-weight: bold; font-size: 12px; padding: 3px 0;")
         files_layout.addWidget(self.files_count_label)
         
-        self.files_list = QListWidget()
-        self.files_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.files_model = TgaListModel(self)
+        self.files_list = QListView()
+        self.files_list.setModel(self.files_model)
+        self.files_list.setUniformItemSizes(True)
+        self.files_list.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
         self.files_list.setStyleSheet("font-size: 12px; padding: 2px;")
         self.files_list.doubleClicked.connect(self._on_file_double_clicked)
+        self.files_list.viewport().installEventFilter(self)
         files_layout.addWidget(self.files_list, 1)
         
         layout.addWidget(files_group, 1)
@@ -776,25 +1642,20 @@ class IconExtractorWindow(QMainWindow):
     
     def _on_file_double_clicked(self, index):
         """Handle double-click on file to preview."""
-        item = self.files_list.item(index.row())
-        if item:
-            filepath = Path(item.data(Qt.ItemDataRole.UserRole))
+        if index.isValid():
+            filepath = Path(self.files_model.path(index.row()))
             dialog = PreviewDialog(filepath, self.converter, self)
             dialog.exec()
     
     def _load_icon(self):
         """Load and set the application icon."""
-        icon_path = Path(__file__).parent / "icon.ico"
-        if not icon_path.exists():
-            icon_path = Path(__file__).parent / "assets" / "icon.ico"
-        
-        if icon_path.exists():
-            pixmap = QPixmap(str(icon_path))
-            if not pixmap.isNull():
-                self.setWindowIcon(QIcon(pixmap))
-                header_pixmap = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                self.header_icon.setPixmap(header_pixmap)
-                return True
+        icon_path = find_icon_path()
+        pixmap = QPixmap(str(icon_path)) if icon_path is not None else QPixmap()
+        if not pixmap.isNull():
+            self.setWindowIcon(QIcon(pixmap))
+            header_pixmap = pixmap.scaled(48, 48, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+            self.header_icon.setPixmap(header_pixmap)
+            return True
         
         self.header_icon.hide()
         return False
@@ -810,174 +1671,59 @@ class IconExtractorWindow(QMainWindow):
     
     def _apply_dark_theme(self):
         """Apply dark theme."""
-        self.setStyleSheet("""
-            QMainWindow, QDialog {
-                background-color: #1e1e1e;
-            }
-            QWidget {
-                background-color: #1e1e1e;
-                color: #e0e0e0;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #404040;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-            }
-            QPushButton {
-                background-color: #3d3d3d;
-                border: 1px solid #555;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QComboBox {
-                background-color: #2d2d2d;
-                border: 1px solid #555;
-                padding: 5px;
-                border-radius: 4px;
-            }
-            QListWidget {
-                background-color: #252525;
-                border: 1px solid #404040;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 6px;
-            }
-            QListWidget::item:selected {
-                background-color: #1565c0;
-            }
-            QListWidget::item:hover {
-                background-color: #2a4d6e;
-            }
-            QProgressBar {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #4caf50;
-            }
-            QTextEdit {
-                background-color: #252525;
-                border: 1px solid #404040;
-            }
-            QLabel {
-                font-size: 12px;
-            }
-        """)
+        self._apply_theme('dark', DARK_QSS)
     
     def _apply_light_theme(self):
         """Apply light theme."""
-        self.setStyleSheet("""
-            QMainWindow, QDialog {
-                background-color: #f5f5f5;
-            }
-            QWidget {
-                background-color: #f5f5f5;
-                color: #333333;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 12px;
-                color: #333333;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px;
-                color: #333333;
-            }
-            QPushButton {
-                background-color: #e0e0e0;
-                border: 1px solid #bbbbbb;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 12px;
-                color: #333333;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-            QComboBox {
-                background-color: #ffffff;
-                border: 1px solid #bbbbbb;
-                padding: 5px;
-                border-radius: 4px;
-                color: #333333;
-            }
-            QListWidget {
-                background-color: #ffffff;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 6px;
-                color: #333333;
-            }
-            QListWidget::item:selected {
-                background-color: #1976d2;
-                color: #ffffff;
-            }
-            QListWidget::item:hover {
-                background-color: #e3f2fd;
-            }
-            QProgressBar {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #4caf50;
-            }
-            QTextEdit {
-                background-color: #2d2818;
-                border: 1px solid #5d4e37;
-                color: #ffc107;
-            }
-            QLabel {
-                font-size: 12px;
-                color: #333333;
-            }
-        """)
+        self._apply_theme('light', LIGHT_QSS)
+    
+    def _apply_theme(self, theme: str, stylesheet: str):
+        """
+        Apply a theme stylesheet to the whole application.
+        Skipped when the theme is already active, since every stylesheet
+        change makes Qt re-polish all widgets.
+        """
+        if self._theme == theme:
+            return
+        self._theme = theme
+        QApplication.instance().setStyleSheet(stylesheet)
     
     def _load_settings(self):
         """Load saved settings."""
         saved_output = self.settings.value("output_dir", str(self.converter.output_dir))
         self.converter.output_dir = Path(saved_output)
+        self._saved_output_dir = str(self.converter.output_dir)
         self.output_label.setText("Documents\\Entropia Universe\\Icons\\")
     
     def _save_settings(self):
-        """Save current settings."""
-        self.settings.setValue("output_dir", str(self.converter.output_dir))
+        """Save current settings, skipping the settings store when nothing changed."""
+        output_dir = str(self.converter.output_dir)
+        if output_dir != self._saved_output_dir:
+            self.settings.setValue("output_dir", output_dir)
+            self._saved_output_dir = output_dir
     
     def _detect_subfolders(self):
-        """Detect version subfolders in the selected cache source(s)."""
-        self.version_combo.clear()
+        """
+        Detect version subfolders in the selected cache source(s).
+        The folders are listed right away; the TGA files of every source's
+        folders are counted on the thread pool, so the source combo counts
+        come from the same scan, and the results applied by
+        _on_folder_scan_finished.
+        """
+        self._scan_generation += 1
+        self._scan_placeholders = False
+        self._scan_changed = set()
         
         # Get the selected source path(s)
         source_index = self.source_combo.currentIndex()
         source_data = self.source_combo.currentData()
         
         if not self.cache_sources or source_data is None:
-            self.cache_label.setText("❌ No cache source selected")
-            self.cache_label.setStyleSheet(
-                "font-family: Consolas; font-size: 10px; color: #f44336; "
-                "padding: 6px 8px; background: #3e2723; border-radius: 3px;"
-            )
+            self._set_cache_label("❌ No cache source selected", _CACHE_LABEL_ERROR_QSS)
+            self._version_folders = []
+            self._scanned_folders = None
+            self._version_entries = None
+            self.version_combo.clear()
             self.version_combo.addItem("No sources available")
             self.status_label.setText("Click 'Browse...' to select the cache folder manually")
             self.files_count_label.setText("No cache folder selected")
@@ -992,62 +1738,204 @@ class IconExtractorWindow(QMainWindow):
             # Scan specific source
             paths_to_scan = [Path(source_data)]
         
-        # Find all version subfolders across selected sources
+        # Find all version subfolders across all sources; the selected ones
+        # fill the version combo, all of them give the source counts
+        all_folders = [
+            (source_path, item)
+            for _, source_path in self.cache_sources
+            for item in find_subfolders(source_path)
+        ]
+        folders = [folder for folder in all_folders if folder[0] in paths_to_scan]
+        
+        # Watch before listing so a change made during the scan is not missed
+        self._watch_folders([item for _, item in all_folders])
+        
+        self._scan_folders = all_folders
+        self._scan_counts = [0] * len(all_folders)
+        if not all_folders:
+            self._on_folder_scan_finished(self._scan_generation)
+            return
+        
+        # Show the folder names while their files are counted, unless the last
+        # scan found exactly these folders (a plain refresh), in which case the
+        # current versions and files stay up until the counts are in
+        if {item for _, item in folders} != self._scanned_folders:
+            placeholders = [("📁 All Folders (counting...)", "all")]
+            for source_path, item in sorted(folders, key=lambda folder: folder[1].name):
+                placeholders.append((self._version_label(item, source_path, "counting..."), str(item)))
+            self._set_version_entries(placeholders)
+            self._scan_placeholders = True
+            # The previous folders no longer apply; list no files until counted
+            self._version_folders = []
+            self._refresh_file_list()
+        
+        self.status_label.setText(f"Scanning {len(all_folders)} version folders...")
+        QThreadPool.globalInstance().start(FolderScan(
+            self._scan_generation,
+            [item for _, item in all_folders],
+            dict(self._tga_cache),
+            self._scan_signals,
+        ))
+    
+    def _on_folder_scanned(self, generation: int, index: int, mtime_ns: Optional[int], files: List[str]):
+        """Cache a version folder's listing and show its icon count as soon as it has been listed."""
+        if generation != self._scan_generation:
+            return
+        
+        count = len(files)
+        self._scan_counts[index] = count
+        source_path, item = self._scan_folders[index]
+        
+        # A folder that changed since the scan started may have been listed
+        # before the change, so only cache listings of unchanged folders
+        if mtime_ns is None:
+            self._tga_cache.pop(item, None)
+        elif item not in self._scan_changed:
+            self._tga_cache[item] = (mtime_ns, files)
+        
+        row = self.version_combo.findData(str(item))
+        if row >= 0 and self._scan_placeholders:
+            self.version_combo.setItemText(row, self._version_label(item, source_path, f"{count} icons"))
+    
+    def _on_folder_scan_finished(self, generation: int):
+        """Apply the counted version folders once every folder has been listed."""
+        if generation != self._scan_generation:
+            return
+        
+        source_index = self.source_combo.currentIndex()
+        source_data = self.source_combo.currentData()
+        if source_index == 0 or source_data == "all":
+            selected_sources = {path for _, path in self.cache_sources}
+        else:
+            selected_sources = {Path(source_data)}
+        
+        source_counts = {path: 0 for _, path in self.cache_sources}
+        self._scanned_folders = set()
+        self._version_folders = []
         subfolders = []
-        for source_path in paths_to_scan:
-            if source_path.exists():
-                for item in source_path.iterdir():
-                    if item.is_dir():
-                        tga_count = len(list(item.glob("*.tga")))
-                        if tga_count > 0:
-                            # Include source name in display
-                            source_name = None
-                            for name, path in self.cache_sources:
-                                if path == source_path:
-                                    source_name = name
-                                    break
-                            subfolders.append((item.name, tga_count, item, source_name))
+        for (source_path, item), count in zip(self._scan_folders, self._scan_counts):
+            if item in self._scan_changed:
+                # Listed before a change on disk: count it again here
+                count = len(self._get_tga_files(item))
+            source_counts[source_path] += count
+            if source_path not in selected_sources:
+                continue
+            self._scanned_folders.add(item)
+            if count:
+                self._version_folders.append(item)
+                subfolders.append((item.name, count, item, source_path))
+        
+        self._set_source_counts(source_counts)
         
         if not subfolders:
             self.cache_label.setText("No version folders found in selected source(s)")
             self.status_label.setText("No TGA files found")
+            self._version_entries = None
+            self.version_combo.clear()
             self.version_combo.addItem("No versions found")
             self.convert_btn.setEnabled(False)
             return
         
         subfolders.sort(key=lambda x: x[0])
+        total_icons = sum(s[1] for s in subfolders)
         
-        for name, count, path, source_name in subfolders:
-            display = f"{name} ({count} icons)"
-            if source_name and len(self.cache_sources) > 1:
-                display += f" [{source_name}]"
-            self.version_combo.addItem(display, str(path))
+        entries = [(f"📁 All Folders ({total_icons} icons)", "all")]
+        for name, count, path, source_path in subfolders:
+            entries.append((self._version_label(path, source_path, f"{count} icons"), str(path)))
         
-        total_icons = sum(s[1] for s in subfolders)
-        self.version_combo.insertItem(0, f"📁 All Folders ({total_icons} icons)", "all")
-        self.version_combo.setCurrentIndex(0)
+        # Only rebuild the combo when the folders or their counts changed,
+        # which also keeps the user's selection across a plain refresh
+        if entries != self._version_entries:
+            self._set_version_entries(entries)
         
         # Update cache label to show active source(s)
         if source_index == 0 or source_data == "all":
             if len(self.cache_sources) == 1:
-                display_path = str(self.cache_sources[0][1])
+                display_path = os.path.normpath(self.cache_sources[0][1])
             else:
                 display_path = f"{len(self.cache_sources)} sources (All)"
         else:
-            display_path = str(source_data)
-        
-        if sys.platform == 'win32':
-            display_path = display_path.replace("/", "\\")
+            display_path = os.path.normpath(source_data)
         
-        self.cache_label.setText(display_path)
-        self.cache_label.setStyleSheet(
-            "font-family: Consolas; font-size: 10px; color: #aaa; "
-            "padding: 6px 8px; background: #252525; border-radius: 3px;"
-        )
+        self._set_cache_label(display_path, _CACHE_LABEL_OK_QSS)
         self.status_label.setText(f"Found {len(subfolders)} version folders with {total_icons} icons")
         
         self._refresh_file_list()
     
+    def _set_cache_label(self, text: str, style: str):
+        """Set the cache path label, re-applying its stylesheet only when the style changes."""
+        self.cache_label.setText(text)
+        if self.cache_label.styleSheet() != style:
+            self.cache_label.setStyleSheet(style)
+    
+    def _version_label(self, folder: Path, source_path: Path, count_text: str) -> str:
+        """Version combo label for a folder, with its source name when there are several sources."""
+        label = f"{folder.name} ({count_text})"
+        if len(self.cache_sources) > 1:
+            # Include source name in display
+            for name, path in self.cache_sources:
+                if path == source_path:
+                    label += f" [{name}]"
+                    break
+        return label
+    
+    def _set_version_entries(self, entries: List[Tuple[str, str]]):
+        """Replace the version combo entries, keeping the selected folder when it is still listed."""
+        selected = self.version_combo.currentData()
+        self._version_entries = entries
+        
+        # Fill the combo with its signals blocked: each insert would otherwise
+        # rebuild the file list, which the caller does once instead
+        self.version_combo.blockSignals(True)
+        try:
+            self.version_combo.clear()
+            for display, data in entries:
+                self.version_combo.addItem(display, data)
+            self.version_combo.setCurrentIndex(max(self.version_combo.findData(selected), 0))
+        finally:
+            self.version_combo.blockSignals(False)
+    
+    def _get_tga_files(self, folder: Path, trust_watcher: bool = False) -> List[str]:
+        """
+        List the TGA files in a version folder in sorted order, reusing the last scan while the folder is unchanged.
+        With trust_watcher, a watched folder's cached listing is returned without checking its mtime.
+        """
+        if trust_watcher and folder in self._watched_folders:
+            cached = self._tga_cache.get(folder)
+            if cached is not None:
+                return cached[1]
+        
+        try:
+            mtime_ns = folder.stat().st_mtime_ns
+        except OSError:
+            self._tga_cache.pop(folder, None)
+            return []
+        
+        cached = self._tga_cache.get(folder)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        files = sorted_tga_files(folder)
+        self._tga_cache[folder] = (mtime_ns, files)
+        return files
+    
+    def _watch_folders(self, folders: List[Path]):
+        """Start watching version folders that are not watched yet."""
+        new = [folder for folder in folders if folder not in self._watched_folders]
+        if not new:
+            return
+        failed = set(self._watcher.addPaths([str(folder) for folder in new]))
+        self._watched_folders.update(folder for folder in new if str(folder) not in failed)
+    
+    def _on_directory_changed(self, path: str):
+        """Drop the cached listing of a watched folder that changed on disk."""
+        folder = Path(path)
+        self._tga_cache.pop(folder, None)
+        self._scan_changed.add(folder)
+        if not os.path.isdir(path):
+            # Qt stops watching folders that are removed
+            self._watched_folders.discard(folder)
+    
     def _on_version_changed(self):
         """Handle version selection change."""
         self._refresh_file_list()
@@ -1070,88 +1958,126 @@ class IconExtractorWindow(QMainWindow):
     
     def _refresh_file_list(self):
         """Refresh the list of found files based on current selection."""
-        self.files_list.clear()
-        self.found_files = []
-        
         # Get the selected source
-        source_index = self.source_combo.currentIndex()
         source_data = self.source_combo.currentData()
         
         if not self.cache_sources or source_data is None:
+            self.files_model.set_files([], [])
+            self.found_files = []
             return
         
-        # Determine which source paths to scan
-        if source_index == 0 or source_data == "all":
-            source_paths = [path for _, path in self.cache_sources]
-        else:
-            source_paths = [Path(source_data)]
-        
         # Get the selected version
         version_data = self.version_combo.currentData()
         
         if version_data == "all" or version_data is None:
-            # Scan all version folders in selected source(s)
-            folders_to_scan = []
-            for source_path in source_paths:
-                if source_path.exists():
-                    folders_to_scan.extend([d for d in source_path.iterdir() if d.is_dir()])
+            # All version folders of the selected source(s), as found by _detect_subfolders
+            folders_to_scan = self._version_folders
         else:
             # Scan specific version folder
             folders_to_scan = [Path(version_data)]
         
-        tga_files = []
-        for folder in folders_to_scan:
-            if folder.exists():
-                tga_files.extend(folder.glob("*.tga"))
-        
-        self.files_count_label.setText(f"Found {len(tga_files)} icon files")
-        self.status_label.setText(f"Found {len(tga_files)} files")
-        
-        for tga_file in sorted(tga_files):
-            try:
-                # Show source in path if multiple sources
-                source_name = None
-                for name, path in self.cache_sources:
-                    if str(tga_file).startswith(str(path)):
-                        source_name = name
-                        break
-                
-                if len(self.cache_sources) > 1 and source_name:
-                    rel_path = f"[{source_name}] {tga_file.parent.name}/{tga_file.name}"
-                else:
-                    rel_path = f"{tga_file.parent.name}/{tga_file.name}"
-            except:
-                rel_path = tga_file.name
-            
-            item = QListWidgetItem(rel_path)
-            item.setData(Qt.ItemDataRole.UserRole, str(tga_file))
-            
-            header = self.converter.read_tga_header(tga_file)
-            if header:
-                item.setToolTip(f"Double-click to preview\n{header.width}x{header.height}, {header.pixel_depth}bpp")
+        # Each folder's listing is already sorted and folders never overlap,
+        # so visiting the folders in order yields the files in sorted order
+        folders = sorted(folders_to_scan)
+        folder_files = [self._get_tga_files(folder, trust_watcher=True) for folder in folders]
+        total = sum(len(files) for files in folder_files)
+        
+        self.files_count_label.setText(f"Found {total} icon files")
+        self.status_label.setText(f"Found {total} files")
+        
+        # Show source in path if multiple sources; every file in a folder
+        # shares the same label prefix, so build it once per folder
+        source_names = {str(path): name for name, path in self.cache_sources}
+        labels = []
+        found_files = []
+        for folder, files in zip(folders, folder_files):
+            source_name = source_names.get(str(folder.parent))
+            if len(self.cache_sources) > 1 and source_name:
+                prefix = f"[{source_name}] {folder.name}/"
             else:
-                item.setToolTip("Double-click to preview")
+                prefix = f"{folder.name}/"
             
-            self.files_list.addItem(item)
-            self.found_files.append(tga_file)
+            labels.extend(prefix + os.path.basename(tga_file) for tga_file in files)
+            found_files.extend(files)
+        
+        # All rows are added with one model reset; a rescan that finds the
+        # same files leaves the list (and its selection) as it is
+        self.files_model.set_files(labels, found_files)
+        self.found_files = found_files
         
-        self.convert_btn.setEnabled(len(tga_files) > 0)
+        self.convert_btn.setEnabled(total > 0)
+    
+    def eventFilter(self, obj, event):
+        """Build file list tooltips on hover, so headers are only read for hovered items."""
+        if obj is self.files_list.viewport() and event.type() == QEvent.Type.ToolTip:
+            index = self.files_list.indexAt(event.pos())
+            if index.isValid():
+                filepath = self.files_model.path(index.row())
+                if filepath not in self._header_cache:
+                    # Show the tooltip now and fill in the resolution once the
+                    # header has been read off the GUI thread
+                    self._tooltip_request = (filepath, event.globalPos())
+                    self._probe_visible_headers(filepath)
+                QToolTip.showText(event.globalPos(), self._file_tooltip(filepath), self.files_list)
+                return True
+        return super().eventFilter(obj, event)
+    
+    def _probe_visible_headers(self, filepath: str):
+        """Read the headers of the hovered file and the other rows in view on the thread pool."""
+        viewport = self.files_list.viewport().rect()
+        first = self.files_list.indexAt(viewport.topLeft()).row()
+        last = self.files_list.indexAt(viewport.bottomLeft()).row()
+        if last < 0:
+            last = self.files_model.rowCount() - 1
+        
+        paths = [filepath]
+        for row in range(max(first, 0), last + 1):
+            paths.append(self.files_model.path(row))
+        
+        paths = [
+            path for path in dict.fromkeys(paths)
+            if path not in self._header_cache and path not in self._headers_pending
+        ]
+        if paths:
+            self._headers_pending.update(paths)
+            QThreadPool.globalInstance().start(HeaderProbe(paths, self.converter, self._header_signals))
+    
+    def _on_header_read(self, filepath: str, header: Optional[TGAHeader]):
+        self._headers_pending.discard(filepath)
+        self._header_cache[filepath] = header
+        
+        if self._tooltip_request and self._tooltip_request[0] == filepath:
+            pos = self._tooltip_request[1]
+            self._tooltip_request = None
+            if QToolTip.isVisible():
+                QToolTip.showText(pos, self._file_tooltip(filepath), self.files_list)
+    
+    def _file_tooltip(self, filepath: str) -> str:
+        """Tooltip for a file list entry, with the TGA resolution once its header has been read."""
+        header = self._header_cache.get(filepath)
+        if header:
+            return f"Double-click to preview\n{header.width}x{header.height}, {header.pixel_depth}bpp"
+        return "Double-click to preview"
     
     def _start_conversion(self):
         """Start batch conversion."""
-        selected_items = self.files_list.selectedItems()
-        if selected_items:
+        selected_rows = self.files_list.selectionModel().selectedRows()
+        if selected_rows:
             files_to_convert = [
-                Path(item.data(Qt.ItemDataRole.UserRole))
-                for item in selected_items
+                Path(self.files_model.path(index.row()))
+                for index in sorted(selected_rows, key=QModelIndex.row)
             ]
         else:
-            files_to_convert = self.found_files
+            files_to_convert = [Path(tga_file) for tga_file in self.found_files]
         
         if not files_to_convert:
             QMessageBox.warning(self, "No Files", "No files selected for extraction.")
             return
         
+        unique_files = ConversionWorker.unique_output_names(files_to_convert)
+        self.duplicate_count = len(files_to_convert) - len(unique_files)
+        files_to_convert = unique_files
+        
         self._save_settings()
         
         self.convert_btn.setEnabled(False)
@@ -1159,20 +2085,21 @@ class IconExtractorWindow(QMainWindow):
         self.progress_bar.setRange(0, len(files_to_convert))
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
+        self.cached_count = 0
         
         self.worker = ConversionWorker(files_to_convert, self.converter)
         self.worker.progress.connect(self._on_progress)
-        self.worker.file_done.connect(self._on_file_done)
+        self.worker.file_done_batch.connect(self._on_files_done)
         self.worker.finished.connect(self._on_finished)
         self.worker.error.connect(self._on_error)
         self.worker.start()
     
-    def _on_progress(self, msg: str):
+    def _on_progress(self, done: int, msg: str):
         self.status_label.setText(msg)
-        self.progress_bar.setValue(self.progress_bar.value() + 1)
+        self.progress_bar.setValue(done)
     
-    def _on_file_done(self, filename: str, output_path: str):
-        pass
+    def _on_files_done(self, batch: list):
+        self.cached_count += sum(1 for _, _, cached in batch if cached)
     
     def _on_finished(self, success: int, total: int):
         self.convert_btn.setEnabled(True)
@@ -1180,10 +2107,20 @@ class IconExtractorWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.status_label.setText(f"Extracted {success}/{total} icons")
         
+        unchanged_note = ""
+        if self.cached_count:
+            unchanged_note = f" ({self.cached_count} unchanged since the last extraction)"
+        duplicate_note = ""
+        if self.duplicate_count:
+            duplicate_note = (
+                f"\n{self.duplicate_count} files were skipped because a file with "
+                f"the same icon name in a later version folder was extracted instead."
+            )
+        
         QMessageBox.information(
             self,
             "Extraction Complete",
-            f"Successfully extracted {success} of {total} icons.\n\n"
+            f"Successfully extracted {success} of {total} icons{unchanged_note}.{duplicate_note}\n\n"
             f"Output location:\n{self.converter.output_dir}\n\n"
             f"Submit these icons to EntropiaNexus.com to help the community!"
         )
@@ -1200,12 +2137,29 @@ class IconExtractorWindow(QMainWindow):
         """Open output folder in file manager."""
         path = str(self.converter.output_dir)
         
-        if os.name == 'nt':
-            os.startfile(path)
-        elif sys.platform == 'darwin':
-            subprocess.run(['open', path])
-        else:
-            subprocess.run(['xdg-open', path])
+        try:
+            # The converter only creates the folder on its first save
+            self.converter.output_dir.mkdir(parents=True, exist_ok=True)
+            if os.name == 'nt':
+                os.startfile(path)
+            else:
+                # Launch detached so the UI never waits on the file manager
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen(
+                    [opener, path],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+        except OSError:
+            # The folder cannot be created (e.g. no permission, missing drive)
+            # or there is no file manager handler (e.g. xdg-open is not installed)
+            QMessageBox.warning(
+                self,
+                "Cannot Open Folder",
+                f"Could not open the output folder:\n{path}"
+            )
     
     def closeEvent(self, event):
         """Save settings on close."""
@@ -1216,13 +2170,19 @@ class IconExtractorWindow(QMainWindow):
         event.accept()
 
 
+@functools.cache
+def find_icon_path() -> Optional[Path]:
+    """Find the application icon file once, next to the script or in assets/."""
+    for icon_path in (Path(__file__).parent / "icon.ico", Path(__file__).parent / "assets" / "icon.ico"):
+        if icon_path.exists():
+            return icon_path
+    return None
+
+
 def set_app_icon(app: QApplication):
     """Set application icon for window and taskbar."""
-    icon_path = Path(__file__).parent / "icon.ico"
-    if not icon_path.exists():
-        icon_path = Path(__file__).parent / "assets" / "icon.ico"
-    
-    if icon_path.exists():
+    icon_path = find_icon_path()
+    if icon_path is not None:
         app.setWindowIcon(QIcon(str(icon_path)))
         return True
     return False
@@ -1253,72 +2213,7 @@ def main():
     set_app_icon(app)
     
     # Dark theme by default
-    app.setStyleSheet("""
-        QMainWindow, QDialog {
-            background-color: #1e1e1e;
-        }
-        QWidget {
-            background-color: #1e1e1e;
-            color: #e0e0e0;
-        }
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #404040;
-            border-radius: 6px;
-            margin-top: 12px;
-            padding-top: 12px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 12px;
-            padding: 0 8px;
-        }
-        QPushButton {
-            background-color: #3d3d3d;
-            border: 1px solid #555;
-            padding: 6px 12px;
-            border-radius: 4px;
-            font-size: 12px;
-        }
-        QPushButton:hover {
-            background-color: #4d4d4d;
-        }
-        QComboBox {
-            background-color: #2d2d2d;
-            border: 1px solid #555;
-            padding: 5px;
-            border-radius: 4px;
-        }
-        QListWidget {
-            background-color: #252525;
-            border: 1px solid #404040;
-            border-radius: 4px;
-        }
-        QListWidget::item {
-            padding: 6px;
-        }
-        QListWidget::item:selected {
-            background-color: #1565c0;
-        }
-        QListWidget::item:hover {
-            background-color: #2a4d6e;
-        }
-        QProgressBar {
-            border: 1px solid #404040;
-            border-radius: 4px;
-            text-align: center;
-        }
-        QProgressBar::chunk {
-            background-color: #4caf50;
-        }
-        QTextEdit {
-            background-color: #252525;
-            border: 1px solid #404040;
-        }
-        QLabel {
-            font-size: 12px;
-        }
-    """)
+    app.setStyleSheet(DARK_QSS)
     
     window = IconExtractorWindow()
     window.show()